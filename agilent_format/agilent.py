@@ -1,25 +1,51 @@
 __version__ = "0.4.5"
 
+from concurrent.futures import ThreadPoolExecutor
 import configparser
+import logging
+import os
 from pathlib import Path
+import re
 import struct
 
 import numpy as np
 
-DEBUG = False
+logger = logging.getLogger(__name__)
 
-def base_data_path(path: Path) -> Path:
+# Data files (.dat, .seq, .dmd, .drd) start with a preamble of 255 float32 values
+_PREAMBLE_SIZE = 255
+
+# Wavenumbers per block in _copy_tile. Block copies of 32 wavenumbers (128 bytes per
+# pixel) were fastest or equal fastest for 32, 64 and 128 pixel FPAs
+_COPY_BLOCK = 32
+
+# Precompiled struct formats
+_DOUBLE = struct.Struct("<d")
+# PtSep (double), StartPt (int), Npts (int), separated by 4 padding bytes
+_PTSEP_STARTPT_NPTS = struct.Struct("<d4xi4xi")
+
+# Square FPA sizes (pixels per tile: edge length), including aggregated images
+_FPA_SIZES = {(2**n)**2: 2**n for n in range(1, 8)}
+
+def base_data_path(path: Path, names=None) -> Path:
     """
     Find the correct base for data files
 
     For example, folder with ["ab9.dmt", "AB9_0000_0000.dmd"] should return "AB9"
+
+    names can be an existing listing of the directory, to avoid reading it again
     """
     if path.suffix == ".dmt":
-        for child in path.parent.iterdir():
-            if child.suffix == ".dmt":
+        if names is None:
+            names = os.listdir(path.parent)
+        primary = (path.stem + "_0000_0000").casefold()
+        # Compare name strings rather than building a Path for every tile
+        for name in names:
+            stem, suffix = os.path.splitext(name)
+            if suffix == ".dmt":
                 continue
-            elif child.stem.casefold() == (path.stem + "_0000_0000").casefold():
-                return child.with_name(child.stem.split("_0000_0000")[0])
+            elif stem.casefold() == primary:
+                return path.parent.joinpath(stem.split("_0000_0000")[0])
     else:
         return path
 
@@ -40,8 +66,25 @@ def check_files(filename, exts):
     takes filename string and list of extensions, checks that they all exist and
     returns a Path
     """
+    return _check_files(filename, exts)[0]
+
+def _check_files(filename, exts):
+    """
+    As check_files, but also returns the directory listing for mosaics (else None)
+    so it can be shared with _scan_tiles
+
+    Mosaics can be opened through any of their files (.dmt, .dms, .dat, ...),
+    so they are recognised by the tile extensions rather than the suffix.
+    """
     p = Path(filename)
-    p = base_data_path(p)
+    # Mosaics need the directory listing anyway (base_data_path, _scan_tiles),
+    # so read it once here. Single images keep the is_file() checks.
+    if p.suffix == ".dmt" or {".dmd", ".drd"}.intersection(exts):
+        names = os.listdir(p.parent)
+    else:
+        names = None
+    p = base_data_path(p, names)
+    found = set(names) if names is not None else set()
     for ext in exts:
         if ext == ".dmt":
             # Always lowercase
@@ -54,18 +97,37 @@ def check_files(filename, exts):
             ps = bsp_path(p)
         else:
             ps = p.with_suffix(ext)
-        if not ps.is_file():
+        # Fall back to is_file() for case-insensitive filesystems
+        if ps.name not in found and not ps.is_file():
             raise OSError('File "{}" was not found.'.format(ps))
-    return p
+    return p, names
 
 def dmt_path(path: Path) -> Path:
     return path.parent.joinpath(path.with_suffix(".dmt").name.lower())
 
-def _readint(f):
-    return struct.unpack("i", f.read(4))[0]
+def _readfloats(f):
+    """
+    Reads the remainder of an open file handle as float32 in a single call
+    """
+    size = os.fstat(f.fileno()).st_size - f.tell()
+    data = np.empty(size // 4, dtype=np.float32)
+    n = f.readinto(data)
+    if n != data.nbytes:
+        # File shrank since fstat(), don't return uninitialized data
+        raise OSError(f'Short read from "{f.name}": {n} of {data.nbytes} bytes')
+    return data
 
-def _readdouble(f):
-    return struct.unpack("d", f.read(8))[0]
+def _willneed(f):
+    """
+    Hints that an open file will be read in full soon, so the kernel can queue
+    readahead for all of it (only where posix_fadvise is available, e.g. Linux)
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            # Only a hint, never fail a load over it
+            pass
 
 def _get_wavenumbers(f):
     """
@@ -73,20 +135,18 @@ def _get_wavenumbers(f):
     calculates wavenumbers array and returns all in dict
     """
     d = {}
-    f.seek(2228)
-    d['StartPt'] = _readint(f)
-    f.seek(2236)
-    d['Npts'] = _readint(f)
+    # PtSep (double) at 2216, StartPt (int) at 2228 and Npts (int) at 2236
     f.seek(2216)
-    d['PtSep'] = _readdouble(f)
-    d['wavenumbers'] = [d['PtSep'] * (d['StartPt'] + i) for i in range(d['Npts'])]
+    hdr = f.read(_PTSEP_STARTPT_NPTS.size)
+    d['PtSep'], d['StartPt'], d['Npts'] = _PTSEP_STARTPT_NPTS.unpack(hdr)
+    d['wavenumbers'] = (np.arange(d['Npts'], dtype=np.float64) + d['StartPt']) * d['PtSep']
 
-    if DEBUG:
+    if logger.isEnabledFor(logging.DEBUG):
         for k,v in d.items():
             if k == "wavenumbers":
-                print(k, len(v), v[0], v[-1], type(v))
+                logger.debug("%s %s %s %s %s", k, len(v), v[0], v[-1], type(v))
             else:
-                print(k,v, type(v))
+                logger.debug("%s %s %s", k, v, type(v))
     return d
 
 def _get_params(f):
@@ -127,7 +187,7 @@ def _get_params(f):
     def _get_prop_d(dat, param):
         part = dat.partition(bytes(param, encoding='utf8'))
         val_b = part[2].partition(bytes("1.00", encoding='utf8'))[2]
-        val = struct.unpack("d", val_b[12:20])[0]
+        val = _DOUBLE.unpack_from(val_b, 12)[0]
         return val
 
     def _get_prop_str(dat, param):
@@ -178,10 +238,8 @@ def _get_ifg_params(f):
     def _get_proptype_data(dat, param):
         part = dat.partition(bytes(param, encoding='utf8'))
         val_b = part[2].partition(bytes("1.00", encoding='utf8'))[2]
-        PtSep = struct.unpack("d", val_b[12:20])[0]
-        StartPt = struct.unpack("i", val_b[24:28])[0]
-        Npts = struct.unpack("i", val_b[32:36])[0]
-        return PtSep, StartPt, Npts
+        # Same layout as the header read in _get_wavenumbers
+        return _PTSEP_STARTPT_NPTS.unpack_from(val_b, 12)
 
     d = {}
     f.seek(0)
@@ -189,15 +247,37 @@ def _get_ifg_params(f):
 
     d['PtSep'], d['StartPt'], d['Npts'] = _get_proptype_data(dat, 'Interferogram')
 
-    if DEBUG:
+    if logger.isEnabledFor(logging.DEBUG):
         for k,v in d.items():
-            print(k,v, type(v))
+            logger.debug("%s %s %s", k, v, type(v))
     return d
 
 
+def _scan_tiles(p_in, ext, names):
+    """
+    Counts mosaic tiles along x (_xxxx_0000) and y (_0000_yyyy)
+    in the directory listing names, and returns them with the size
+    of the _0000_0000 primary tile (as float32)
+    """
+    # Match glob() case sensitivity on Windows
+    flags = re.IGNORECASE if os.name == 'nt' else 0
+    tile_re = re.compile(re.escape(p_in.stem) + r"_([0-9]{4})_([0-9]{4})" + re.escape(ext), flags)
+    xtiles = 0
+    ytiles = 0
+    for name in names:
+        m = tile_re.fullmatch(name)
+        if m:
+            x, y = m.groups()
+            if y == "0000":
+                xtiles += 1
+            if x == "0000":
+                ytiles += 1
+    p = p_in.parent.joinpath(p_in.stem + "_0000_0000" + ext)
+    return xtiles, ytiles, p.stat().st_size // 4
+
 def _fpa_size(datasize, Npts):
     """
-    Determine FPA size (255 block preamble, wavenumbers, sqrt)
+    Determine FPA size (255 block preamble, wavenumbers, lookup of pixels per tile)
     FPA is most likely 128 or 64 pixels square
     This also provides sanity check for wavelengths array
 
@@ -205,25 +285,35 @@ def _fpa_size(datasize, Npts):
         datasize (int): size of data (after reading as float32)
         Npts (int):     number of points in spectra
     """
-    fpa_full = datasize - 255
-    fpa_sq = fpa_full / Npts
-    fpasize = int(np.sqrt(fpa_sq))
-    if fpa_sq not in [(2**n)**2 for n in range(1,8)]:
+    fpa_full = datasize - _PREAMBLE_SIZE
+    fpa_sq, remainder = divmod(fpa_full, Npts)
+    fpasize = _FPA_SIZES.get(fpa_sq) if remainder == 0 else None
+    if fpasize is None:
+        fpa_sq = fpa_full / Npts
+        fpasize = int(np.sqrt(fpa_sq))
         raise ValueError(f"Unexpected FPA size: {fpa_sq}, ({fpasize}, {fpasize}, {Npts})")
     return fpasize
 
 def _reshape_tile(data, shape):
     """
-    Reshape and transpose FPA tile data
+    Reshape and transpose FPA tile data (with the preamble already skipped)
     """
-    # Reshape ndarray
-    data = data[255:]
-    # Using shape attribute to raise error if a copy is made of the array
-    data.shape = shape
+    # Reshape ndarray (tile data is contiguous, so this is a view, not a copy)
+    data = data.reshape(shape)
     # Transpose to standard [ rows, columns, wavelengths ]
     data = np.transpose(data, (1,2,0))
     return data
 
+def _copy_tile(dst, tile, block=_COPY_BLOCK):
+    """
+    Copy a transposed tile from _reshape_tile into dst
+
+    The copy is done in blocks along the wavenumber axis so that each block of the
+    (wavenumbers, rows, columns) source stays in cache while it is transposed.
+    """
+    for k in range(0, tile.shape[2], block):
+        dst[:, :, k:k+block] = tile[:, :, k:k+block]
+
 
 def get_visible_images(p):
     """
@@ -295,13 +385,14 @@ class agilentImage(DataObject):
     Attributes beyond .info and .data are provided for consistency with MATLAB code
 
     Args:
-        filename (str): full path to .dat file
-        MAT (bool):     Output array using image coordinates (matplotlib/MATLAB)
+        filename (str):   full path to .dat file
+        MAT (bool):       Output array using image coordinates (matplotlib/MATLAB)
+        dtype (np.dtype): Set dtype of output array (float16, float32 or float64)
 
     Attributes:
         info (dict):            Dictionary of acquisition information
         data (:obj:`ndarray`):  3-dimensional array (height x width x wavenumbers)
-        wavenumbers (list):     Wavenumbers in order of .data array
+        wavenumbers (:obj:`ndarray`): Wavenumbers in order of .data array
         width (int):            Width of image in pixels (rows)
         height (int):           Width of image in pixels (columns)
         filename (str):         Full path to .bsp file
@@ -311,10 +402,11 @@ class agilentImage(DataObject):
     https://bitbucket.org/AlexHenderson/agilent-file-formats
     """
 
-    def __init__(self, filename, MAT=False):
+    def __init__(self, filename, MAT=False, dtype=np.float32):
         super().__init__()
         p = check_files(filename, [".dat", ".bsp"])
         self.MAT = MAT
+        self.dtype = dtype
         self._get_bsp_info(p)
         self._get_dat(p)
 
@@ -333,9 +425,12 @@ class agilentImage(DataObject):
     def _get_dat(self, p_in):
         p = p_in.with_suffix(".dat")
         with p.open(mode='rb') as f:
-            data = np.fromfile(f, dtype=np.float32)
-        fpasize = _fpa_size(data.size, self.info['Npts'])
+            f.seek(_PREAMBLE_SIZE * 4)
+            data = _readfloats(f)
+        fpasize = _fpa_size(data.size + _PREAMBLE_SIZE, self.info['Npts'])
         data = _reshape_tile(data, (self.info['Npts'], fpasize, fpasize))
+        # File data is always float32
+        data = data.astype(self.dtype, copy=False)
 
         if self.MAT:
             # Rotate and flip tile to match matplotlib/MATLAB image coordinates
@@ -343,25 +438,33 @@ class agilentImage(DataObject):
 
         self.data = data
 
-        if DEBUG:
-            print("FPA Size is {}".format(fpasize))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("FPA Size is %s", fpasize)
 
 
 def make_tile_loader(path, Npts, fpasize):
     """
     Returns a closure which will load the tile at :path: when called.
 
+    The tile is a read-only view of the memory-mapped file, so copying it into
+    a mosaic reads straight from the page cache.
+
     If the file is not present at loading time, return expected array filled with NaNs
+    (a read-only broadcast of a single NaN, so no tile-sized buffer is allocated)
     """
     def load_tile_data(path=path):
         shape = (Npts, fpasize, fpasize)
         shape_t = (shape[1], shape[2], shape[0])
         if path.is_file():
             with path.open(mode='rb') as f:
-                tile = np.fromfile(f, dtype=np.float32)
+                _willneed(f)
+                # The mapping starts at the page boundary, so the payload is still
+                # 1020 bytes into the page (alignment unchanged, only the preamble
+                # is no longer part of the array)
+                tile = np.memmap(f, dtype=np.float32, mode='r', offset=_PREAMBLE_SIZE * 4)
             tile = _reshape_tile(tile, shape)
         else:
-            tile = np.full(shape_t, np.nan, dtype=np.float32)
+            tile = np.broadcast_to(np.float32(np.nan), shape_t)
         return tile
     return load_tile_data
 
@@ -380,10 +483,10 @@ class agilentMosaicTiles(DataObject):
 
     def __init__(self, filename, MAT=False):
         super().__init__()
-        p = check_files(filename, [".dmt", ".dmd"])
+        p, names = _check_files(filename, [".dmt", ".dmd"])
         self.MAT = MAT
         self._get_dmt_info(p)
-        self._get_tiles(p)
+        self._get_tiles(p, *_scan_tiles(p, ".dmd", names))
 
         self.wavenumbers = self.info['wavenumbers']
         self.width = self.tiles.shape[0] * self.info['fpasize']
@@ -400,22 +503,17 @@ class agilentMosaicTiles(DataObject):
             self.info.update(_get_wavenumbers(f))
             self.info.update(_get_params(f))
 
-    def _get_tiles(self, p_in):
-        # Determine mosiac dimensions by counting .dmd files
-        xtiles = sum(1 for _ in
-                p_in.parent.glob(p_in.stem + "_[0-9][0-9][0-9][0-9]_0000.dmd"))
-        ytiles = sum(1 for _ in
-                p_in.parent.glob(p_in.stem + "_0000_[0-9][0-9][0-9][0-9].dmd"))
-        # _0000_0000.dmd primary file
-        p = p_in.parent.joinpath(p_in.stem + "_0000_0000.dmd")
+    def _get_tiles(self, p_in, xtiles, ytiles, datasize):
+        # Mosaic dimensions from counting .dmd files, FPA size from the
+        # _0000_0000.dmd primary file (see _scan_tiles)
         Npts = self.info['Npts']
-        fpasize = self.info['fpasize'] = _fpa_size(p.stat().st_size / 4, Npts)
+        fpasize = self.info['fpasize'] = _fpa_size(datasize, Npts)
 
-        if DEBUG:
-            print("{0} x {1} tiles found".format(xtiles, ytiles))
-            print("FPA size is {}".format(fpasize))
-            print("Total dimensions are {0} x {1} or {2} spectra.".format(
-                xtiles*fpasize, ytiles*fpasize, xtiles*ytiles*fpasize**2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s x %s tiles found", xtiles, ytiles)
+            logger.debug("FPA size is %s", fpasize)
+            logger.debug("Total dimensions are %s x %s or %s spectra.",
+                         xtiles*fpasize, ytiles*fpasize, xtiles*ytiles*fpasize**2)
 
         tiles = np.zeros((xtiles, ytiles), dtype=object)
         for (x, y) in np.ndindex(tiles.shape):
@@ -433,12 +531,16 @@ class agilentMosaic(agilentMosaicTiles):
     Args:
         filename (str):   full path to .dmt file
         MAT (bool):       Output array using image coordinates (matplotlib/MATLAB)
-        dtype (np.dtype): Set dtype of output array (float32 or float64)
+        dtype (np.dtype): Set dtype of output array (float16, float32 or float64)
+        project (str):    Reduce each spectrum while loading instead of keeping
+                          the full array. Only "sum" is supported.
 
     Attributes:
         info (dict):            Dictionary of acquisition information
         data (:obj:`ndarray`):  3-dimensional array (height x width x wavenumbers)
-        wavenumbers (list):     Wavenumbers in order of .data array
+                                or, with project="sum", 2-dimensional float64 array
+                                (height x width) of spectra sums
+        wavenumbers (:obj:`ndarray`): Wavenumbers in order of .data array
         width (int):            Width of mosaic in pixels (rows)
         height (int):           Width of mosaic in pixels (columns)
         filename (str):         Full path to .dmt file
@@ -448,9 +550,12 @@ class agilentMosaic(agilentMosaicTiles):
     https://bitbucket.org/AlexHenderson/agilent-file-formats
     """
 
-    def __init__(self, filename, MAT=False, dtype=np.float32):
+    def __init__(self, filename, MAT=False, dtype=np.float32, project=None):
+        if project not in (None, "sum"):
+            raise ValueError(f"Unsupported projection: {project}")
         super().__init__(filename, MAT)
         self.dtype = dtype
+        self.project = project
         self._get_data()
 
     def _get_data(self):
@@ -459,24 +564,41 @@ class agilentMosaic(agilentMosaicTiles):
         Npts = self.info['Npts']
         fpasize = self.info['fpasize']
         # Allocate array
-        # (rows, columns, wavenumbers)
-        data = np.zeros((ytiles*fpasize, xtiles*fpasize, Npts),
-                        dtype=self.dtype)
-        if DEBUG:
-            print("self.tiles: ", self.tiles.shape)
-            print("self.data: ", data.shape)
+        # (rows, columns, wavenumbers) or (rows, columns) for a projection
+        # Every tile is written below (missing tiles as NaNs), so skip zero-filling
+        if self.project == "sum":
+            data = np.empty((ytiles*fpasize, xtiles*fpasize), dtype=np.float64)
+        else:
+            data = np.empty((ytiles*fpasize, xtiles*fpasize, Npts),
+                            dtype=self.dtype)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("self.tiles: %s", self.tiles.shape)
+            logger.debug("self.data: %s", data.shape)
 
-        for (x, y) in np.ndindex(self.tiles.shape):
+        def load_tile(x, y):
             tile = self.tiles[x, y]()
             if self.MAT:
                 # Rotate and flip tile to match matplotlib/MATLAB image coordinates
                 tile = np.flipud(tile)
-                data[y*fpasize:(y+1)*fpasize, x*fpasize:(x+1)*fpasize, :] = tile
+                rows = slice(y*fpasize, (y+1)*fpasize)
             else:
                 # Tile data is in normal cartesian coordinates
                 # but tile numbering (000x_000y)
                 # is left-to-right, top-to-bottom (image coordinates)
-                data[(ytiles-y-1)*fpasize:(ytiles-y)*fpasize, (x)*fpasize:(x+1)*fpasize, :] = tile
+                rows = slice((ytiles-y-1)*fpasize, (ytiles-y)*fpasize)
+            cols = slice(x*fpasize, (x+1)*fpasize)
+            if self.project == "sum":
+                np.sum(tile, axis=2, dtype=np.float64, out=data[rows, cols])
+            else:
+                _copy_tile(data[rows, cols, :], tile)
+
+        # File reads and array copies release the GIL, so tiles load in parallel.
+        # Each tile is written to its own slice of data.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(load_tile, x, y) for (x, y) in np.ndindex(self.tiles.shape)]
+            for future in futures:
+                # Re-raise any exception from the tile loaders
+                future.result()
 
         self.data = data
 
@@ -486,8 +608,9 @@ class agilentImageIFG(DataObject):
     Extracts the interferograms from an Agilent single tile FPA image.
 
     Args:
-        filename (str): full path to .seq file
-        MAT (bool):     Output array using image coordinates (matplotlib/MATLAB)
+        filename (str):   full path to .seq file
+        MAT (bool):       Output array using image coordinates (matplotlib/MATLAB)
+        dtype (np.dtype): Set dtype of output array (float16, float32 or float64)
 
     Attributes:
         info (dict):            Dictionary of acquisition information
@@ -495,10 +618,11 @@ class agilentImageIFG(DataObject):
         filename (str):         Full path to .bsp file
     """
 
-    def __init__(self, filename, MAT=False):
+    def __init__(self, filename, MAT=False, dtype=np.float32):
         super().__init__()
         p = check_files(filename, [".seq", ".bsp"])
         self.MAT = MAT
+        self.dtype = dtype
         self._get_bsp_info(p)
         self._get_seq(p)
 
@@ -514,9 +638,12 @@ class agilentImageIFG(DataObject):
     def _get_seq(self, p_in):
         p = p_in.with_suffix(".seq")
         with p.open(mode='rb') as f:
-            data = np.fromfile(f, dtype=np.float32)
-        fpasize = _fpa_size(data.size, self.info['Npts'])
+            f.seek(_PREAMBLE_SIZE * 4)
+            data = _readfloats(f)
+        fpasize = _fpa_size(data.size + _PREAMBLE_SIZE, self.info['Npts'])
         data = _reshape_tile(data, (self.info['Npts'], fpasize, fpasize))
+        # File data is always float32
+        data = data.astype(self.dtype, copy=False)
 
         if self.MAT:
             # Rotate and flip tile to match matplotlib/MATLAB image coordinates
@@ -524,8 +651,8 @@ class agilentImageIFG(DataObject):
 
         self.data = data
 
-        if DEBUG:
-            print("FPA Size is {}".format(fpasize))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("FPA Size is %s", fpasize)
 
 
 class agilentMosaicIFGTiles(DataObject):
@@ -542,10 +669,10 @@ class agilentMosaicIFGTiles(DataObject):
 
     def __init__(self, filename, MAT=False):
         super().__init__()
-        p = check_files(filename, [".dmt", ".drd"])
+        p, names = _check_files(filename, [".dmt", ".drd"])
         self.MAT = MAT
         self._get_dmt_info(p)
-        self._get_tiles(p)
+        self._get_tiles(p, *_scan_tiles(p, ".drd", names))
 
         self.filename = dmt_path(p).as_posix()
 
@@ -556,22 +683,17 @@ class agilentMosaicIFGTiles(DataObject):
             self.info.update(_get_ifg_params(f))
             self.info.update(_get_params(f))
 
-    def _get_tiles(self, p_in):
-        # Determine mosiac dimensions by counting .drd files
-        xtiles = sum(1 for _ in
-                p_in.parent.glob(p_in.stem + "_[0-9][0-9][0-9][0-9]_0000.drd"))
-        ytiles = sum(1 for _ in
-                p_in.parent.glob(p_in.stem + "_0000_[0-9][0-9][0-9][0-9].drd"))
-        # _0000_0000.drd primary file
-        p = p_in.parent.joinpath(p_in.stem + "_0000_0000.drd")
+    def _get_tiles(self, p_in, xtiles, ytiles, datasize):
+        # Mosaic dimensions from counting .drd files, FPA size from the
+        # _0000_0000.drd primary file (see _scan_tiles)
         Npts = self.info['Npts']
-        fpasize = self.info['fpasize'] = _fpa_size(p.stat().st_size / 4, Npts)
+        fpasize = self.info['fpasize'] = _fpa_size(datasize, Npts)
 
-        if DEBUG:
-            print("{0} x {1} tiles found".format(xtiles, ytiles))
-            print("FPA size is {}".format(fpasize))
-            print("Total dimensions are {0} x {1} or {2} spectra.".format(
-                xtiles*fpasize, ytiles*fpasize, xtiles*ytiles*fpasize**2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s x %s tiles found", xtiles, ytiles)
+            logger.debug("FPA size is %s", fpasize)
+            logger.debug("Total dimensions are %s x %s or %s spectra.",
+                         xtiles*fpasize, ytiles*fpasize, xtiles*ytiles*fpasize**2)
 
         tiles = np.zeros((xtiles, ytiles), dtype=object)
         for (x, y) in np.ndindex(tiles.shape):
@@ -587,7 +709,7 @@ class agilentMosaicIFG(agilentMosaicIFGTiles):
     Args:
         filename (str):   full path to .dmt file
         MAT (bool):       Output array using image coordinates (matplotlib/MATLAB)
-        dtype (np.dtype): Set dtype of output array (float32 or float64))
+        dtype (np.dtype): Set dtype of output array (float16, float32 or float64)
 
     Attributes:
         info (dict):            Dictionary of acquisition information
@@ -607,22 +729,31 @@ class agilentMosaicIFG(agilentMosaicIFGTiles):
         fpasize = self.info['fpasize']
         # Allocate array
         # (rows, columns, wavenumbers)
-        data = np.zeros((ytiles*fpasize, xtiles*fpasize, Npts),
+        # Every tile is written below (missing tiles as NaNs), so skip zero-filling
+        data = np.empty((ytiles*fpasize, xtiles*fpasize, Npts),
                         dtype=self.dtype)
-        if DEBUG:
-            print("self.tiles: ", self.tiles.shape)
-            print("self.data: ", data.shape)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("self.tiles: %s", self.tiles.shape)
+            logger.debug("self.data: %s", data.shape)
 
-        for (x, y) in np.ndindex(self.tiles.shape):
+        def load_tile(x, y):
             tile = self.tiles[x, y]()
             if self.MAT:
                 # Rotate and flip tile to match matplotlib/MATLAB image coordinates
                 tile = np.flipud(tile)
-                data[y*fpasize:(y+1)*fpasize, x*fpasize:(x+1)*fpasize, :] = tile
+                _copy_tile(data[y*fpasize:(y+1)*fpasize, x*fpasize:(x+1)*fpasize, :], tile)
             else:
                 # Tile data is in normal cartesian coordinates
                 # but tile numbering (000x_000y)
                 # is left-to-right, top-to-bottom (image coordinates)
-                data[(ytiles-y-1)*fpasize:(ytiles-y)*fpasize, (x)*fpasize:(x+1)*fpasize, :] = tile
+                _copy_tile(data[(ytiles-y-1)*fpasize:(ytiles-y)*fpasize, (x)*fpasize:(x+1)*fpasize, :], tile)
+
+        # File reads and array copies release the GIL, so tiles load in parallel.
+        # Each tile is written to its own slice of data.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(load_tile, x, y) for (x, y) in np.ndindex(self.tiles.shape)]
+            for future in futures:
+                # Re-raise any exception from the tile loaders
+                future.result()
 
         self.data = data
@@ -141,4 +141,13 @@ class TestFilenames(unittest.TestCase):
         self.add_files_to_dir(filenames)
         dmt = self._temp_path.joinpath(filenames[0])
         self.assertEqual(agilent_format.base_data_path(dmt).name, "AB9.seq")
-        self.assertEqual(agilent_format.check_files(dmt, ['.dat', '.bsp']).name, "AB9.seq")
\ No newline at end of file
+        self.assertEqual(agilent_format.check_files(dmt, ['.dat', '.bsp']).name, "AB9.seq")
+
+    def test_dat_missing_bsp(self):
+        filenames = ["ab9.dat",
+                     "ab9.seq",
+                     ]
+        self.add_files_to_dir(filenames)
+        dat = self._temp_path.joinpath(filenames[0])
+        with self.assertRaises(OSError):
+            agilent_format.check_files(dat, ['.dat', '.bsp'])
@@ -1,6 +1,9 @@
 import unittest
 from pathlib import Path
 
+from numpy import empty, float16, float32, float64, fromfile, ndarray, ndindex
+from numpy.testing import assert_array_equal
+
 from agilent_format import agilentImage
 
 DAT = Path(__file__).parent.parent.joinpath("datasets/4_noimage_agg256.dat")
@@ -13,6 +16,8 @@ class TestImage(unittest.TestCase):
         Npts = ai.info['Npts']
         self.assertEqual(Npts, 9)
         self.assertEqual(Npts, len(ai.wavenumbers))
+        self.assertIsInstance(ai.wavenumbers, ndarray)
+        self.assertIs(ai.wavenumbers, ai.info['wavenumbers'])
         self.assertEqual(ai.wavenumbers[0], ai.info['StartPt'] * ai.info['PtSep'])
         self.assertEqual(ai.wavenumbers[-1],
                          (ai.info['StartPt'] + Npts - 1) * ai.info['PtSep'])
@@ -34,4 +39,26 @@ class TestImage(unittest.TestCase):
         # Confirm image orientation
         self.assertAlmostEqual(ai.data[7, 1, 1], 1.27181053)
         self.assertAlmostEqual(ai.data[7, 2, 2], 1.27506005)
-        self.assertAlmostEqual(ai.data[6, 2, 3], 0.30882764)
\ No newline at end of file
+        self.assertAlmostEqual(ai.data[6, 2, 3], 0.30882764)
+
+    def test_load_image_MAT_reference(self):
+        ai = agilentImage(DAT, MAT=True)
+        Npts = ai.info['Npts']
+        fpasize = ai.data.shape[0]
+        # Element-wise reference from the (wavenumbers, rows, columns) file layout,
+        # with MAT reversing the rows
+        raw = fromfile(DAT, dtype=float32, offset=255 * 4)
+        expected = empty((fpasize, fpasize, Npts), dtype=float32)
+        for (r, c, k) in ndindex(expected.shape):
+            expected[fpasize - 1 - r, c, k] = raw[k * fpasize**2 + r * fpasize + c]
+        assert_array_equal(ai.data, expected)
+
+    def test_load_image_64(self):
+        ai = agilentImage(DAT, MAT=False, dtype=float64)
+        self.assertEqual(ai.data.dtype, float64)
+        self.assertAlmostEqual(ai.data[1, 2, 3], 0.30882764)
+
+    def test_load_image_16(self):
+        ai = agilentImage(DAT, MAT=False, dtype=float16)
+        self.assertEqual(ai.data.dtype, float16)
+        self.assertAlmostEqual(ai.data[1, 2, 3], 0.30882764, places=3)
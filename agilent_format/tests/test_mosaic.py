@@ -3,7 +3,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from numpy import float64, isnan
+from numpy import float16, float64, isnan
+from numpy.testing import assert_allclose
 
 from agilent_format import agilentMosaic
 
@@ -30,6 +31,11 @@ class TestMosaic(unittest.TestCase):
         self.assertAlmostEqual(ai.data[0, 2, 2], 1.14063489)
         self.assertAlmostEqual(ai.data[1, 2, 3], 0.28298783)
 
+    def test_load_mosaic_dms(self):
+        ai = agilentMosaic(DMT.parent.joinpath("5_Mosaic_agg1024.dms"), MAT=False)
+        self.assertEqual(ai.data.shape, (8, 4, ai.info['Npts']))
+        self.assertAlmostEqual(ai.data[1, 2, 3], 0.28298783)
+
     def test_load_mosaic_MAT(self):
         ai = agilentMosaic(DMT, MAT=True)
         # Confirm image orientation
@@ -41,6 +47,23 @@ class TestMosaic(unittest.TestCase):
         ai = agilentMosaic(DMT, MAT=False, dtype=float64)
         self.assertAlmostEqual(ai.data[1, 2, 3], 0.28298783)
 
+    def test_load_mosaic_16(self):
+        ai = agilentMosaic(DMT, MAT=False, dtype=float16)
+        self.assertEqual(ai.data.dtype, float16)
+        self.assertAlmostEqual(ai.data[1, 2, 3], 0.28298783, places=3)
+
+    def test_load_mosaic_project_sum(self):
+        ai = agilentMosaic(DMT, MAT=False)
+        ai_sum = agilentMosaic(DMT, MAT=False, project="sum")
+        self.assertEqual(ai_sum.data.shape, ai.data.shape[:2])
+        assert_allclose(ai_sum.data, ai.data.sum(axis=2, dtype=float64))
+        ai_sum = agilentMosaic(DMT, MAT=True, project="sum")
+        self.assertAlmostEqual(ai_sum.data[7, 1], ai.data[0, 1].sum(dtype=float64))
+
+    def test_load_mosaic_project_unknown(self):
+        with self.assertRaises(ValueError):
+            agilentMosaic(DMT, project="max")
+
     def test_load_mosaic_vis(self):
         ai = agilentMosaic(DMT, MAT=False)
         self.assertEqual(len(ai.vis), 2)
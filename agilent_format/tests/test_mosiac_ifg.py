@@ -27,6 +27,11 @@ class TestMosaicIFG(unittest.TestCase):
         self.assertAlmostEqual(aifg.data[5, 1, 0], 0.7116039)
         self.assertAlmostEqual(aifg.data[6, 2, 0], 0.48532167)
 
+    def test_load_ifg_mosaic_dms(self):
+        aifg = agilentMosaicIFG(DMT.parent.joinpath("5_Mosaic_agg1024.dms"), MAT=False)
+        self.assertEqual(aifg.data.shape, (8, 4, 311))
+        self.assertAlmostEqual(aifg.data[5, 1, 0], 0.7116039)
+
     def test_load_ifg_mosaic_MAT(self):
         aifg = agilentMosaicIFG(DMT, MAT=True)
         # Confirm image orientation
@@ -1,4 +1,8 @@
+import io
 import unittest
+from unittest import mock
+
+import numpy as np
 
 from agilent_format import agilent
 
@@ -14,3 +18,52 @@ class TestUtils(unittest.TestCase):
         datasize = 64 * 32 * Npts + 255
         with self.assertRaises(ValueError):
             agilent._fpa_size(datasize, Npts)
+
+    def test_reshape_tile_view(self):
+        Npts = 3
+        fpasize = 4
+        data = np.arange(Npts * fpasize**2, dtype=np.float32)
+        tile = agilent._reshape_tile(data, (Npts, fpasize, fpasize))
+        self.assertEqual(tile.shape, (fpasize, fpasize, Npts))
+        self.assertEqual(data.shape, (Npts * fpasize**2,))
+        # No intermediate copies of the tile are made
+        self.assertTrue(np.shares_memory(tile, data))
+        self.assertEqual(tile[1, 2, 0], 1 * fpasize + 2)
+        self.assertEqual(tile[1, 2, 2], 2 * fpasize**2 + 1 * fpasize + 2)
+
+    def test_reshape_tile_reference(self):
+        Npts = 5
+        fpasize = 4
+        data = np.random.default_rng(0).random(Npts * fpasize**2, dtype=np.float32)
+        tile = agilent._reshape_tile(data, (Npts, fpasize, fpasize))
+        expected = np.empty((fpasize, fpasize, Npts), dtype=np.float32)
+        for (r, c, k) in np.ndindex(expected.shape):
+            expected[r, c, k] = data[k * fpasize**2 + r * fpasize + c]
+        np.testing.assert_array_equal(tile, expected)
+
+    def test_copy_tile(self):
+        Npts = 37
+        fpasize = 8
+        data = np.random.default_rng(0).random(Npts * fpasize**2, dtype=np.float32)
+        tile = agilent._reshape_tile(data, (Npts, fpasize, fpasize))
+        dst = np.empty((fpasize, fpasize, Npts), dtype=np.float64)
+        agilent._copy_tile(dst, np.flipud(tile), block=8)
+        np.testing.assert_array_equal(dst, np.flipud(tile))
+
+    def test_fpa_size_partial_spectra(self):
+        Npts = 100
+        datasize = 64**2 * Npts + 255 + 1
+        with self.assertRaises(ValueError):
+            agilent._fpa_size(datasize, Npts)
+
+    def test_readfloats_short_read(self):
+        class ShortFile(io.BytesIO):
+            name = "short.dat"
+
+            def fileno(self):
+                return 0
+
+        with mock.patch.object(agilent.os, "fstat") as fstat:
+            fstat.return_value.st_size = 16
+            with self.assertRaises(OSError):
+                agilent._readfloats(ShortFile(b"\x00" * 8))